@@ -13,33 +13,43 @@ Comprehensive testing framework for:
 """
 
 import os
+import re
 import sys
 import csv
 import time
+import asyncio
+import multiprocessing
 import subprocess
 import argparse
-import tempfile
 import shutil
 import random
 import string
+import tempfile
+import atexit
+import functools
+import itertools
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Tuple, Optional
+from dataclasses import dataclass, fields
 from datetime import datetime
 
 try:
     import psutil
+    import numpy as np
     import matplotlib.pyplot as plt
     import matplotlib
     matplotlib.use('Agg')  # Non-interactive backend
+    from matplotlib.backend_bases import FigureCanvasBase
     from tqdm import tqdm
 except ImportError as e:
     print(f"Error: Missing required dependency: {e}")
-    print("Install with: pip3 install psutil matplotlib tqdm")
+    print("Install with: pip3 install psutil numpy matplotlib tqdm")
     sys.exit(1)
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Data class to store benchmark results"""
     compression_algorithm: str
@@ -58,6 +68,24 @@ class BenchmarkResult:
     throughput_mbps: float
 
 
+# Results keyed by (compression_algorithm, encryption_algorithm)
+ResultGroups = Dict[Tuple[str, str], List[BenchmarkResult]]
+
+_NUMPY_TYPES = {int: np.int64, float: np.float64, bool: np.bool_}
+
+
+def _results_table(results: List[BenchmarkResult]) -> np.recarray:
+    """Column-oriented record array of results, one field per BenchmarkResult field"""
+    result_fields = fields(BenchmarkResult)
+    dtype = [
+        (f.name, f"U{max((len(getattr(r, f.name)) for r in results), default=1)}")
+        if f.type is str else (f.name, _NUMPY_TYPES[f.type])
+        for f in result_fields
+    ]
+    rows = [tuple(getattr(r, f.name) for f in result_fields) for r in results]
+    return np.rec.array(rows, dtype=dtype)
+
+
 class ResourceMonitor:
     """Monitor system resources for a process"""
     
@@ -68,8 +96,8 @@ class ResourceMonitor:
         except psutil.NoSuchProcess:
             self.process = None
     
-    def get_cpu_percent(self, interval: float = 0.1) -> float:
-        """Get CPU usage percentage"""
+    def get_cpu_percent(self, interval: Optional[float] = None) -> float:
+        """Get CPU usage percentage since the previous call (non-blocking)"""
         if self.process and self.process.is_running():
             return self.process.cpu_percent(interval=interval)
         return 0.0
@@ -80,6 +108,15 @@ class ResourceMonitor:
             return self.process.memory_info().rss / 1024 / 1024
         return 0.0
     
+    def snapshot(self) -> Tuple[float, float]:
+        """
+        Read CPU percentage and memory (MB) in one batched /proc access
+        Returns: (cpu_percent, memory_mb)
+        """
+        with self.process.oneshot():
+            return (self.process.cpu_percent(0.0),
+                    self.process.memory_info().rss / 1024 / 1024)
+    
     def get_open_files_count(self) -> int:
         """Get count of open file descriptors"""
         if self.process and self.process.is_running():
@@ -103,23 +140,71 @@ class ResourceMonitor:
             pass
         
         return False
+    
+    async def sample_until_exit(self, exited: asyncio.Future, base_ms: float = 20,
+                                max_ms: float = 500) -> Tuple[List[float], List[float]]:
+        """
+        Sample CPU and memory until the `exited` future completes
+        
+        The interval starts at base_ms and backs off exponentially up to max_ms,
+        so short runs still get several samples and long runs few wakeups.
+        Returns: (cpu_samples, mem_samples)
+        """
+        cpu_samples = []
+        mem_samples = []
+        
+        if not self.process:
+            return cpu_samples, mem_samples
+        
+        try:
+            # Prime the counter; later non-blocking calls measure since the last one
+            self.process.cpu_percent(None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return cpu_samples, mem_samples
+        
+        n = 0
+        while not exited.done():
+            interval = min(max_ms, base_ms * 1.5 ** n)
+            # Wakes as soon as the process exits instead of sleeping out the interval
+            await asyncio.wait({exited}, timeout=interval / 1000)
+            if exited.done():
+                break
+            n += 1
+            
+            try:
+                cpu, mem = self.snapshot()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                break
+            
+            cpu_samples.append(cpu)
+            mem_samples.append(mem)
+        
+        return cpu_samples, mem_samples
 
 
 class TestDataGenerator:
     """Generate test data with various patterns"""
     
+    WORDS = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", 
+             "adipiscing", "elit", "sed", "do", "eiusmod", "tempor"]
+    
     @staticmethod
-    def random_data(size: int) -> bytes:
+    def random_data(size: int, seed: Optional[int] = None) -> bytes:
         """Generate random binary data"""
-        return os.urandom(size)
+        return np.random.default_rng(seed).bytes(size)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _text_chunk() -> bytes:
+        """Random ~64KB block of words, built once and tiled by text_data"""
+        text = " ".join(random.choices(TestDataGenerator.WORDS, k=10000))
+        return (text + " ").encode('utf-8')
     
     @staticmethod
     def text_data(size: int) -> bytes:
         """Generate text data (good for compression)"""
-        words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", 
-                 "adipiscing", "elit", "sed", "do", "eiusmod", "tempor"]
-        text = " ".join(random.choices(words, k=size // 6))
-        return text[:size].encode('utf-8')
+        chunk = TestDataGenerator._text_chunk()
+        return (chunk * (size // len(chunk) + 1))[:size]
     
     @staticmethod
     def repetitive_data(size: int) -> bytes:
@@ -130,33 +215,39 @@ class TestDataGenerator:
     
     @staticmethod
     def create_test_files(directory: Path, num_files: int, file_size: int, 
-                         pattern: str = "random") -> List[Path]:
+                         pattern: str = "random", seed: Optional[int] = None) -> List[Path]:
         """Create test files in directory"""
         directory.mkdir(parents=True, exist_ok=True)
-        files = []
         
         generator_map = {
-            "random": TestDataGenerator.random_data,
+            "random": functools.partial(TestDataGenerator.random_data, seed=seed),
             "text": TestDataGenerator.text_data,
             "repetitive": TestDataGenerator.repetitive_data
         }
         
-        data_generator = generator_map.get(pattern, TestDataGenerator.random_data)
+        data_generator = generator_map.get(pattern, generator_map["random"])
         
-        for i in range(num_files):
+        # Generate one buffer for the whole configuration and slice it per file
+        data = memoryview(data_generator(num_files * file_size))
+        
+        def write_file(i: int) -> Path:
             file_path = directory / f"testfile_{i:04d}.dat"
-            data = data_generator(file_size)
-            file_path.write_bytes(data)
-            files.append(file_path)
+            file_path.write_bytes(data[i * file_size:(i + 1) * file_size])
+            return file_path
         
-        return files
+        # Writes release the GIL, so a thread pool overlaps the open/write/close syscalls
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(write_file, range(num_files)))
 
 
 class ValgrindAnalyzer:
     """Analyze valgrind output for memory leaks"""
     
+    # e.g. "==1234==    definitely lost: 1,024 bytes in 2 blocks"
+    DEFINITELY_LOST = re.compile(rb"definitely lost:\s+([\d,]+)\s+bytes")
+    
     @staticmethod
-    def run_valgrind(binary: str, args: List[str], timeout: int = 300) -> Tuple[bool, str]:
+    def run_valgrind(binary: str, args: List[str], timeout: int = 300) -> Tuple[bool, bytes]:
         """
         Run valgrind and detect memory leaks
         Returns: (has_leaks, output)
@@ -173,38 +264,247 @@ class ValgrindAnalyzer:
         try:
             result = subprocess.run(
                 valgrind_cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=timeout
             )
             
-            output = result.stderr  # Valgrind outputs to stderr
+            output = result.stderr  # Valgrind outputs to stderr (kept as bytes)
             
-            # Check for leak summary
-            has_leaks = False
-            if "definitely lost:" in output:
-                # Extract the bytes lost
-                for line in output.split('\n'):
-                    if "definitely lost:" in line:
-                        bytes_lost = line.split()[3].replace(',', '')
-                        if bytes_lost != '0':
-                            has_leaks = True
-                            break
+            # Check leak summaries for any non-zero "definitely lost" count
+            has_leaks = any(
+                match.group(1).replace(b',', b'') != b'0'
+                for match in ValgrindAnalyzer.DEFINITELY_LOST.finditer(output)
+            )
             
             return has_leaks, output
             
         except subprocess.TimeoutExpired:
-            return False, "Timeout expired"
+            return False, b"Timeout expired"
         except FileNotFoundError:
             print("Warning: valgrind not found, skipping memory leak detection")
-            return False, "valgrind not available"
+            return False, b"valgrind not available"
+
+
+def _tree_size(root: Path) -> int:
+    """Total size in bytes of regular files under root (os.scandir walk)"""
+    total = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return total
+
+
+# GNU du (-b) is only assumed on Linux
+_HAVE_DU = sys.platform.startswith("linux") and shutil.which("du") is not None
+
+
+def _du(root: Path) -> int:
+    """Apparent size in bytes of the files in a flat directory, measured by du"""
+    out = subprocess.check_output(["du", "-sb", str(root)], stderr=subprocess.DEVNULL)
+    # du also counts the directory entry itself
+    return int(out.split()[0]) - root.stat().st_size
+
+
+def _output_size(root: Path) -> int:
+    """Size of a gsea output directory (du on Linux, scandir walk elsewhere)"""
+    if _HAVE_DU:
+        try:
+            return _du(root)
+        except (OSError, ValueError, subprocess.CalledProcessError):
+            pass
+    return _tree_size(root)
+
+
+# Figure reused by every plot rendered in this process (see _reusable_figure)
+_FIGURE: Optional[plt.Figure] = None
+
+
+def _reusable_figure(figsize: Tuple[float, float]) -> plt.Figure:
+    """Return this process's figure, cleared and resized, creating it on first use"""
+    global _FIGURE
+    if _FIGURE is None:
+        _FIGURE = plt.figure(figsize=figsize)
+    else:
+        _FIGURE.clf()
+        _FIGURE.set_size_inches(figsize)
+    return _FIGURE
+
+
+def _render_plot(plot_fn: Callable[[], plt.Figure], path: Path, formats: Tuple[str, ...]):
+    """Build one plot and save it in each requested format (runs in a worker process)"""
+    plt.style.use('seaborn-v0_8-darkgrid')
+    
+    fig = plot_fn()
+    fig.tight_layout()
+    for fmt in formats:
+        fig.savefig(path.with_suffix(f".{fmt}"), dpi=300 if fmt == 'png' else None)
+
+
+def _plot_memory_vs_files(grouped: ResultGroups) -> plt.Figure:
+    """Plot memory usage vs number of files"""
+    fig = _reusable_figure((12, 6))
+    ax = fig.add_subplot(111)
+    
+    for (comp_alg, enc_alg), filtered in grouped.items():
+        x = [r.num_files for r in filtered]
+        y = [r.memory_mb for r in filtered]
+        
+        ax.plot(x, y, marker='o', label=f"{comp_alg}+{enc_alg}")
+    
+    ax.set_xlabel('Number of Files', fontsize=12)
+    ax.set_ylabel('Memory Usage (MB)', fontsize=12)
+    ax.set_title('Memory Usage vs Number of Files', fontsize=14, fontweight='bold')
+    ax.legend(loc='best', fontsize=9)
+    ax.grid(True, alpha=0.3)
+    
+    return fig
+
+
+def _plot_time_vs_filesize(grouped: ResultGroups) -> plt.Figure:
+    """Plot execution time vs file size"""
+    fig = _reusable_figure((12, 6))
+    ax = fig.add_subplot(111)
+    
+    for (comp_alg, enc_alg), filtered in grouped.items():
+        x = [r.file_size / 1024 for r in filtered]  # KB
+        y = [r.time_seconds for r in filtered]
+        
+        ax.plot(x, y, marker='s', label=f"{comp_alg}+{enc_alg}")
+    
+    ax.set_xlabel('File Size (KB)', fontsize=12)
+    ax.set_ylabel('Execution Time (seconds)', fontsize=12)
+    ax.set_title('Execution Time vs File Size', fontsize=14, fontweight='bold')
+    ax.legend(loc='best', fontsize=9)
+    ax.grid(True, alpha=0.3)
+    
+    return fig
+
+
+def _plot_compression_comparison(grouped: ResultGroups) -> plt.Figure:
+    """Compare compression ratios across algorithms"""
+    fig = _reusable_figure((14, 7))
+    ax = fig.add_subplot(111)
+    
+    # Calculate average compression ratio for each combination
+    labels = [f"{comp_alg}\n+{enc_alg}" for comp_alg, enc_alg in grouped]
+    values = [sum(r.compression_ratio for r in rs) / len(rs) for rs in grouped.values()]
+    
+    bars = ax.bar(range(len(labels)), values, color='steelblue', alpha=0.8)
+    ax.set_xticks(range(len(labels)))
+    ax.set_xticklabels(labels, fontsize=9)
+    ax.set_ylabel('Compression Ratio (%)', fontsize=12)
+    ax.set_title('Average Compression Ratio by Algorithm Combination', 
+                 fontsize=14, fontweight='bold')
+    ax.grid(True, axis='y', alpha=0.3)
+    
+    # Add value labels on bars
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+               f'{height:.1f}%', ha='center', va='bottom', fontsize=9)
+    
+    return fig
+
+
+def _plot_throughput_comparison(grouped: ResultGroups) -> plt.Figure:
+    """Compare throughput across algorithms"""
+    fig = _reusable_figure((14, 7))
+    ax = fig.add_subplot(111)
+    
+    labels = [f"{comp_alg}\n+{enc_alg}" for comp_alg, enc_alg in grouped]
+    values = [sum(r.throughput_mbps for r in rs) / len(rs) for rs in grouped.values()]
+    
+    bars = ax.bar(range(len(labels)), values, color='darkorange', alpha=0.8)
+    ax.set_xticks(range(len(labels)))
+    ax.set_xticklabels(labels, fontsize=9)
+    ax.set_ylabel('Throughput (MB/s)', fontsize=12)
+    ax.set_title('Average Throughput by Algorithm Combination', 
+                 fontsize=14, fontweight='bold')
+    ax.grid(True, axis='y', alpha=0.3)
+    
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+               f'{height:.2f}', ha='center', va='bottom', fontsize=9)
+    
+    return fig
+
+
+def _plot_resource_heatmap(table: np.recarray, compression_algorithms: List[str],
+                           encryption_algorithms: List[str]) -> plt.Figure:
+    """Create heatmap of resource efficiency"""
+    fig = _reusable_figure((16, 6))
+    ax1, ax2 = fig.subplots(1, 2)
+    
+    n_comp = len(compression_algorithms)
+    n_enc = len(encryption_algorithms)
+    
+    # Flat (comp, enc) cell of every result; per-cell means via bincount
+    comp_codes = (table.compression_algorithm[:, None]
+                  == np.array(compression_algorithms)).argmax(axis=1)
+    enc_codes = (table.encryption_algorithm[:, None]
+                 == np.array(encryption_algorithms)).argmax(axis=1)
+    cells = comp_codes * n_enc + enc_codes
+    counts = np.maximum(np.bincount(cells, minlength=n_comp * n_enc), 1)
+    
+    def cell_means(values: np.ndarray) -> np.ndarray:
+        sums = np.bincount(cells, weights=values, minlength=n_comp * n_enc)
+        return (sums / counts).reshape(n_comp, n_enc)
+    
+    # CPU heatmap
+    cpu_matrix = cell_means(table.cpu_percent)
+    
+    im1 = ax1.imshow(cpu_matrix, cmap='YlOrRd', aspect='auto')
+    ax1.set_xticks(range(len(encryption_algorithms)))
+    ax1.set_yticks(range(len(compression_algorithms)))
+    ax1.set_xticklabels(encryption_algorithms)
+    ax1.set_yticklabels(compression_algorithms)
+    ax1.set_title('Average CPU Usage (%)', fontsize=12, fontweight='bold')
+    
+    # Add text annotations
+    for i in range(len(compression_algorithms)):
+        for j in range(len(encryption_algorithms)):
+            ax1.text(j, i, f'{cpu_matrix[i, j]:.1f}',
+                    ha="center", va="center", color="black", fontsize=10)
+    
+    fig.colorbar(im1, ax=ax1)
+    
+    # Memory heatmap
+    mem_matrix = cell_means(table.memory_mb)
+    
+    im2 = ax2.imshow(mem_matrix, cmap='YlGnBu', aspect='auto')
+    ax2.set_xticks(range(len(encryption_algorithms)))
+    ax2.set_yticks(range(len(compression_algorithms)))
+    ax2.set_xticklabels(encryption_algorithms)
+    ax2.set_yticklabels(compression_algorithms)
+    ax2.set_title('Average Memory Usage (MB)', fontsize=12, fontweight='bold')
+    
+    for i in range(len(compression_algorithms)):
+        for j in range(len(encryption_algorithms)):
+            ax2.text(j, i, f'{mem_matrix[i, j]:.1f}',
+                    ha="center", va="center", color="black", fontsize=10)
+    
+    fig.colorbar(im2, ax=ax2)
+    
+    return fig
 
 
 class GSEABenchmark:
     """Main benchmark suite for GSEA project"""
     
-    def __init__(self, binary_path: str, results_dir: str = "benchmark_results"):
+    def __init__(self, binary_path: str, results_dir: str = "benchmark_results",
+                 threads: int = 1, plot_formats: Tuple[str, ...] = ("png", "pdf"),
+                 capture_output: bool = False):
         self.binary_path = Path(binary_path)
+        self.threads = threads
+        self.capture_output = capture_output
+        self.plot_formats = tuple(plot_formats)
         self.results_dir = Path(results_dir)
         self.results_dir.mkdir(parents=True, exist_ok=True)
         
@@ -218,6 +518,13 @@ class GSEABenchmark:
         self.logs_dir = self.results_dir / "logs"
         self.logs_dir.mkdir(exist_ok=True)
         
+        # Scratch space for generated inputs and gsea outputs. Fresh directories
+        # so that only what this run created is removed at exit
+        self.inputs_dir = Path(tempfile.mkdtemp(dir=self.results_dir, prefix="inputs_"))
+        self.outputs_dir = Path(tempfile.mkdtemp(dir=self.results_dir, prefix="outputs_"))
+        atexit.register(shutil.rmtree, self.inputs_dir, ignore_errors=True)
+        atexit.register(shutil.rmtree, self.outputs_dir, ignore_errors=True)
+        
         # Verify binary exists
         if not self.binary_path.exists():
             raise FileNotFoundError(f"Binary not found: {self.binary_path}")
@@ -226,8 +533,65 @@ class GSEABenchmark:
         self.compression_algorithms = ["lz77", "huffman", "rle", "lzw"]
         self.encryption_algorithms = ["aes128", "chacha20", "salsa20", "rc4"]
         
+        # The comp × enc grid is fixed per run, so enumerate it once
+        self.algorithm_pairs = tuple(itertools.product(self.compression_algorithms,
+                                                       self.encryption_algorithms))
+        
+        # Concurrent gsea processes, sized so threads per process fit the CPU count
+        self.max_workers = max(1, min((os.cpu_count() or 1) // self.threads, 16))
+        
         # Results storage
         self.results: List[BenchmarkResult] = []
+        
+        # Generated input directories, keyed by (num_files, file_size, pattern)
+        self._input_dirs: Dict[Tuple[int, int, str], Path] = {}
+    
+    def _get_input_dir(self, num_files: int, file_size: int, pattern: str) -> Path:
+        """Generate test files once per configuration and reuse the directory"""
+        key = (num_files, file_size, pattern)
+        if key not in self._input_dirs:
+            input_dir = self.inputs_dir / f"{pattern}_{num_files}x{file_size}"
+            TestDataGenerator.create_test_files(input_dir, num_files, file_size, pattern)
+            self._input_dirs[key] = input_dir
+        return self._input_dirs[key]
+    
+    async def _run_monitored(self, cmd: List[str], log_path: Optional[Path] = None,
+                             timeout: int = 300) -> Tuple[int, List[float], List[float], bool]:
+        """
+        Run a command while sampling its resources concurrently
+        
+        Output goes to log_path when given, otherwise it is discarded.
+        Returns: (exit_code, cpu_samples, mem_samples, zombies)
+        """
+        if log_path:
+            with open(log_path, 'wb') as log_file:
+                # The child keeps its own copy of the descriptor
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=log_file,
+                    stderr=asyncio.subprocess.STDOUT
+                )
+        else:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+        monitor = ResourceMonitor(process.pid)
+        
+        exited = asyncio.ensure_future(process.wait())
+        sampler = asyncio.create_task(monitor.sample_until_exit(exited))
+        
+        try:
+            await asyncio.wait_for(asyncio.shield(exited), timeout=timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await exited
+            await sampler
+            return -1, [0], [0], False
+        
+        cpu_samples, mem_samples = await sampler
+        return process.returncode, cpu_samples, mem_samples, monitor.check_zombies()
     
     def run_single_test(self, comp_alg: str, enc_alg: str, input_dir: Path, 
                        output_dir: Path, num_files: int, file_size: int,
@@ -243,7 +607,7 @@ class GSEABenchmark:
             "-i", str(input_dir),
             "-o", str(output_dir),
             "-k", "benchmark_test_key_123",
-            "-t", "4"  # Use 4 threads
+            "-t", str(self.threads)
         ]
         
         # Calculate original size
@@ -257,48 +621,20 @@ class GSEABenchmark:
             )
             
             # Save valgrind output
-            log_file = self.logs_dir / f"valgrind_{comp_alg}_{enc_alg}.log"
-            log_file.write_text(valgrind_output)
+            log_file = self.logs_dir / f"valgrind_{comp_alg}_{enc_alg}_{num_files}x{file_size}.log"
+            log_file.write_bytes(valgrind_output)
         else:
             has_leaks = False
         
-        # Start monitoring
-        start_time = time.time()
-        
-        try:
-            # Run the process
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            
-            # Monitor resources
-            monitor = ResourceMonitor(process.pid)
-            
-            cpu_samples = []
-            mem_samples = []
-            
-            # Monitor while running
-            while process.poll() is None:
-                cpu_samples.append(monitor.get_cpu_percent())
-                mem_samples.append(monitor.get_memory_mb())
-                time.sleep(0.1)
-            
-            # Wait for completion
-            stdout, stderr = process.communicate(timeout=300)
-            exit_code = process.returncode
-            
-            # Check for zombies
-            zombies = monitor.check_zombies()
-            
-        except subprocess.TimeoutExpired:
-            process.kill()
-            exit_code = -1
-            cpu_samples = [0]
-            mem_samples = [0]
-            zombies = False
+        log_path = None
+        if self.capture_output:
+            log_path = self.logs_dir / f"gsea_{comp_alg}_{enc_alg}_{num_files}x{file_size}.log"
         
+        # Run and monitor the process
+        start_time = time.time()
+        exit_code, cpu_samples, mem_samples, zombies = asyncio.run(
+            self._run_monitored(cmd, log_path)
+        )
         end_time = time.time()
         elapsed_time = end_time - start_time
         
@@ -307,11 +643,7 @@ class GSEABenchmark:
         avg_mem = sum(mem_samples) / len(mem_samples) if mem_samples else 0
         
         # Calculate compressed size
-        compressed_size = 0
-        if output_dir.exists():
-            for file in output_dir.rglob("*"):
-                if file.is_file():
-                    compressed_size += file.stat().st_size
+        compressed_size = _output_size(output_dir) if output_dir.exists() else 0
         
         compressed_size_mb = compressed_size / 1024 / 1024
         compression_ratio = (1 - compressed_size / original_size) * 100 if original_size > 0 else 0
@@ -345,9 +677,7 @@ class GSEABenchmark:
             use_valgrind: Whether to run valgrind (slow!)
         """
         
-        total_tests = (len(self.compression_algorithms) * 
-                      len(self.encryption_algorithms) * 
-                      len(file_configs))
+        total_tests = len(self.algorithm_pairs) * len(file_configs)
         
         print(f"\n{'='*70}")
         print(f"  GSEA Benchmark Suite")
@@ -357,44 +687,72 @@ class GSEABenchmark:
         print(f"  Encryption algorithms: {', '.join(self.encryption_algorithms)}")
         print(f"  File configurations: {len(file_configs)}")
         print(f"  Total tests: {total_tests}")
+        print(f"  Parallel jobs: {self.max_workers} × {self.threads} thread(s)")
         print(f"  Valgrind enabled: {use_valgrind}")
         print(f"{'='*70}\n")
         
+        # One task per (config, compression, encryption), in natural order.
+        # Test data is shared by every run of the same configuration.
+        tasks = [
+            (num_files, file_size, comp_alg, enc_alg,
+             self._get_input_dir(num_files, file_size, data_pattern))
+            for num_files, file_size in file_configs
+            for comp_alg, enc_alg in self.algorithm_pairs
+        ]
+        
+        # Longest-processing-time first: start the largest configurations
+        # early so a slow test does not run alone after the pool drains
+        schedule = sorted(range(len(tasks)), key=lambda i: -tasks[i][0] * tasks[i][1])
+        results: List[Optional[BenchmarkResult]] = [None] * len(tasks)
+        
+        pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        
+        # No tqdm monitor thread: generate_plots forks afterwards, and forking
+        # while another thread is alive can leave its locks held in the child
+        tqdm.monitor_interval = 0
+        
         with tqdm(total=total_tests, desc="Running benchmarks", unit="test") as pbar:
-            for num_files, file_size in file_configs:
-                # Create temporary directories
-                temp_base = tempfile.mkdtemp(prefix="gsea_bench_")
-                temp_base_path = Path(temp_base)
-                
-                try:
-                    # Generate test data
-                    input_dir = temp_base_path / "input"
-                    TestDataGenerator.create_test_files(
-                        input_dir, num_files, file_size, data_pattern
-                    )
+            futures = {}
+            try:
+                for i in schedule:
+                    num_files, file_size, comp_alg, enc_alg, input_dir = tasks[i]
+                    output_dir = self.outputs_dir / f"{i:04d}_{comp_alg}_{enc_alg}"
+                    output_dir.mkdir(parents=True, exist_ok=True)
                     
-                    # Test all algorithm combinations
-                    for comp_alg in self.compression_algorithms:
-                        for enc_alg in self.encryption_algorithms:
-                            output_dir = temp_base_path / f"output_{comp_alg}_{enc_alg}"
-                            output_dir.mkdir(exist_ok=True)
-                            
-                            pbar.set_description(
-                                f"Testing {comp_alg}+{enc_alg} "
-                                f"({num_files} files × {file_size//1024}KB)"
-                            )
-                            
-                            result = self.run_single_test(
-                                comp_alg, enc_alg, input_dir, output_dir,
-                                num_files, file_size, use_valgrind
-                            )
-                            
-                            self.results.append(result)
-                            pbar.update(1)
+                    future = pool.submit(
+                        self.run_single_test,
+                        comp_alg, enc_alg, input_dir, output_dir,
+                        num_files, file_size, use_valgrind
+                    )
+                    futures[future] = (i, output_dir)
                 
-                finally:
-                    # Cleanup temporary files
-                    shutil.rmtree(temp_base, ignore_errors=True)
+                for future in as_completed(futures):
+                    i, output_dir = futures[future]
+                    num_files, file_size, comp_alg, enc_alg, _ = tasks[i]
+                    
+                    # Store by task index so results keep their natural order
+                    results[i] = future.result()
+                    
+                    # Cleanup outputs as soon as they are measured; inputs stay cached until exit
+                    shutil.rmtree(output_dir, ignore_errors=True)
+                    
+                    pbar.set_description(
+                        f"Tested {comp_alg}+{enc_alg} "
+                        f"({num_files} files × {file_size//1024}KB)"
+                    )
+                    pbar.update(1)
+            except BaseException:
+                # Ctrl-C or a failed test: drop queued tests instead of waiting for them.
+                # Cancel here too, since the pool may be collected before its manager
+                # thread gets around to honouring cancel_futures.
+                for future in futures:
+                    future.cancel()
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+        
+        pool.shutdown()
+        
+        self.results.extend(results)
         
         print(f"\n✅ Benchmarks complete! {len(self.results)} tests executed.\n")
     
@@ -406,11 +764,11 @@ class GSEABenchmark:
             print("No results to save")
             return
         
+        table = _results_table(self.results)
         with open(csv_path, 'w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=asdict(self.results[0]).keys())
-            writer.writeheader()
-            for result in self.results:
-                writer.writerow(asdict(result))
+            writer = csv.writer(csvfile)
+            writer.writerow(table.dtype.names)
+            writer.writerows(table.tolist())
         
         print(f"📊 Results saved to: {csv_path}")
     
@@ -422,214 +780,48 @@ class GSEABenchmark:
         
         print("\n📈 Generating visualizations...")
         
-        # Set style
-        plt.style.use('seaborn-v0_8-darkgrid')
-        
-        # 1. Memory usage vs number of files
-        self._plot_memory_vs_files()
-        
-        # 2. Time vs file size
-        self._plot_time_vs_filesize()
-        
-        # 3. Algorithm comparison (compression ratio)
-        self._plot_compression_comparison()
-        
-        # 4. Throughput comparison
-        self._plot_throughput_comparison()
+        # Index results by algorithm combination once for all plots
+        grouped = self._group_results()
+        
+        plots = {
+            # 1. Memory usage vs number of files
+            'memory_vs_files': functools.partial(_plot_memory_vs_files, grouped),
+            # 2. Time vs file size
+            'time_vs_filesize': functools.partial(_plot_time_vs_filesize, grouped),
+            # 3. Algorithm comparison (compression ratio)
+            'compression_comparison': functools.partial(_plot_compression_comparison, grouped),
+            # 4. Throughput comparison
+            'throughput_comparison': functools.partial(_plot_throughput_comparison, grouped),
+            # 5. Resource efficiency heatmap
+            'resource_heatmap': functools.partial(
+                _plot_resource_heatmap, _results_table(self.results),
+                self.compression_algorithms, self.encryption_algorithms
+            ),
+        }
         
-        # 5. Resource efficiency heatmap
-        self._plot_resource_heatmap()
+        # Render plots concurrently; each worker has its own pyplot state.
+        # On Linux, forked workers inherit the already-imported matplotlib/numpy
+        # instead of paying the import again (spawn/forkserver would). By now the
+        # benchmark pool is shut down and run_benchmarks started no tqdm monitor,
+        # so this process is single-threaded when it forks.
+        max_workers = min(len(plots), os.cpu_count() or 1)
+        mp_context = multiprocessing.get_context("fork") if sys.platform.startswith("linux") else None
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as pool:
+            futures = [
+                pool.submit(_render_plot, plot_fn, self.plots_dir / name, self.plot_formats)
+                for name, plot_fn in plots.items()
+            ]
+            for future in futures:
+                future.result()
         
         print(f"✅ Plots saved to: {self.plots_dir}/")
     
-    def _plot_memory_vs_files(self):
-        """Plot memory usage vs number of files"""
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        # Group by algorithm combination
-        for comp_alg in self.compression_algorithms:
-            for enc_alg in self.encryption_algorithms:
-                filtered = [r for r in self.results 
-                           if r.compression_algorithm == comp_alg 
-                           and r.encryption_algorithm == enc_alg]
-                
-                if not filtered:
-                    continue
-                
-                x = [r.num_files for r in filtered]
-                y = [r.memory_mb for r in filtered]
-                
-                ax.plot(x, y, marker='o', label=f"{comp_alg}+{enc_alg}")
-        
-        ax.set_xlabel('Number of Files', fontsize=12)
-        ax.set_ylabel('Memory Usage (MB)', fontsize=12)
-        ax.set_title('Memory Usage vs Number of Files', fontsize=14, fontweight='bold')
-        ax.legend(loc='best', fontsize=9)
-        ax.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(self.plots_dir / 'memory_vs_files.png', dpi=300)
-        plt.savefig(self.plots_dir / 'memory_vs_files.pdf')
-        plt.close()
-    
-    def _plot_time_vs_filesize(self):
-        """Plot execution time vs file size"""
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        for comp_alg in self.compression_algorithms:
-            for enc_alg in self.encryption_algorithms:
-                filtered = [r for r in self.results 
-                           if r.compression_algorithm == comp_alg 
-                           and r.encryption_algorithm == enc_alg]
-                
-                if not filtered:
-                    continue
-                
-                x = [r.file_size / 1024 for r in filtered]  # KB
-                y = [r.time_seconds for r in filtered]
-                
-                ax.plot(x, y, marker='s', label=f"{comp_alg}+{enc_alg}")
-        
-        ax.set_xlabel('File Size (KB)', fontsize=12)
-        ax.set_ylabel('Execution Time (seconds)', fontsize=12)
-        ax.set_title('Execution Time vs File Size', fontsize=14, fontweight='bold')
-        ax.legend(loc='best', fontsize=9)
-        ax.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(self.plots_dir / 'time_vs_filesize.png', dpi=300)
-        plt.savefig(self.plots_dir / 'time_vs_filesize.pdf')
-        plt.close()
-    
-    def _plot_compression_comparison(self):
-        """Compare compression ratios across algorithms"""
-        fig, ax = plt.subplots(figsize=(14, 7))
-        
-        # Calculate average compression ratio for each combination
-        combinations = {}
+    def _group_results(self) -> ResultGroups:
+        """Group results by (compression, encryption) in run order"""
+        grouped = defaultdict(list)
         for result in self.results:
-            key = f"{result.compression_algorithm}\n+{result.encryption_algorithm}"
-            if key not in combinations:
-                combinations[key] = []
-            combinations[key].append(result.compression_ratio)
-        
-        labels = list(combinations.keys())
-        values = [sum(v)/len(v) for v in combinations.values()]
-        
-        bars = ax.bar(range(len(labels)), values, color='steelblue', alpha=0.8)
-        ax.set_xticks(range(len(labels)))
-        ax.set_xticklabels(labels, fontsize=9)
-        ax.set_ylabel('Compression Ratio (%)', fontsize=12)
-        ax.set_title('Average Compression Ratio by Algorithm Combination', 
-                     fontsize=14, fontweight='bold')
-        ax.grid(True, axis='y', alpha=0.3)
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{height:.1f}%', ha='center', va='bottom', fontsize=9)
-        
-        plt.tight_layout()
-        plt.savefig(self.plots_dir / 'compression_comparison.png', dpi=300)
-        plt.savefig(self.plots_dir / 'compression_comparison.pdf')
-        plt.close()
-    
-    def _plot_throughput_comparison(self):
-        """Compare throughput across algorithms"""
-        fig, ax = plt.subplots(figsize=(14, 7))
-        
-        combinations = {}
-        for result in self.results:
-            key = f"{result.compression_algorithm}\n+{result.encryption_algorithm}"
-            if key not in combinations:
-                combinations[key] = []
-            combinations[key].append(result.throughput_mbps)
-        
-        labels = list(combinations.keys())
-        values = [sum(v)/len(v) for v in combinations.values()]
-        
-        bars = ax.bar(range(len(labels)), values, color='darkorange', alpha=0.8)
-        ax.set_xticks(range(len(labels)))
-        ax.set_xticklabels(labels, fontsize=9)
-        ax.set_ylabel('Throughput (MB/s)', fontsize=12)
-        ax.set_title('Average Throughput by Algorithm Combination', 
-                     fontsize=14, fontweight='bold')
-        ax.grid(True, axis='y', alpha=0.3)
-        
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{height:.2f}', ha='center', va='bottom', fontsize=9)
-        
-        plt.tight_layout()
-        plt.savefig(self.plots_dir / 'throughput_comparison.png', dpi=300)
-        plt.savefig(self.plots_dir / 'throughput_comparison.pdf')
-        plt.close()
-    
-    def _plot_resource_heatmap(self):
-        """Create heatmap of resource efficiency"""
-        import numpy as np
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
-        
-        # CPU heatmap
-        cpu_matrix = np.zeros((len(self.compression_algorithms), 
-                              len(self.encryption_algorithms)))
-        
-        for i, comp_alg in enumerate(self.compression_algorithms):
-            for j, enc_alg in enumerate(self.encryption_algorithms):
-                filtered = [r for r in self.results 
-                           if r.compression_algorithm == comp_alg 
-                           and r.encryption_algorithm == enc_alg]
-                if filtered:
-                    cpu_matrix[i, j] = sum(r.cpu_percent for r in filtered) / len(filtered)
-        
-        im1 = ax1.imshow(cpu_matrix, cmap='YlOrRd', aspect='auto')
-        ax1.set_xticks(range(len(self.encryption_algorithms)))
-        ax1.set_yticks(range(len(self.compression_algorithms)))
-        ax1.set_xticklabels(self.encryption_algorithms)
-        ax1.set_yticklabels(self.compression_algorithms)
-        ax1.set_title('Average CPU Usage (%)', fontsize=12, fontweight='bold')
-        
-        # Add text annotations
-        for i in range(len(self.compression_algorithms)):
-            for j in range(len(self.encryption_algorithms)):
-                ax1.text(j, i, f'{cpu_matrix[i, j]:.1f}',
-                        ha="center", va="center", color="black", fontsize=10)
-        
-        plt.colorbar(im1, ax=ax1)
-        
-        # Memory heatmap
-        mem_matrix = np.zeros((len(self.compression_algorithms), 
-                              len(self.encryption_algorithms)))
-        
-        for i, comp_alg in enumerate(self.compression_algorithms):
-            for j, enc_alg in enumerate(self.encryption_algorithms):
-                filtered = [r for r in self.results 
-                           if r.compression_algorithm == comp_alg 
-                           and r.encryption_algorithm == enc_alg]
-                if filtered:
-                    mem_matrix[i, j] = sum(r.memory_mb for r in filtered) / len(filtered)
-        
-        im2 = ax2.imshow(mem_matrix, cmap='YlGnBu', aspect='auto')
-        ax2.set_xticks(range(len(self.encryption_algorithms)))
-        ax2.set_yticks(range(len(self.compression_algorithms)))
-        ax2.set_xticklabels(self.encryption_algorithms)
-        ax2.set_yticklabels(self.compression_algorithms)
-        ax2.set_title('Average Memory Usage (MB)', fontsize=12, fontweight='bold')
-        
-        for i in range(len(self.compression_algorithms)):
-            for j in range(len(self.encryption_algorithms)):
-                ax2.text(j, i, f'{mem_matrix[i, j]:.1f}',
-                        ha="center", va="center", color="black", fontsize=10)
-        
-        plt.colorbar(im2, ax=ax2)
-        
-        plt.tight_layout()
-        plt.savefig(self.plots_dir / 'resource_heatmap.png', dpi=300)
-        plt.savefig(self.plots_dir / 'resource_heatmap.pdf')
-        plt.close()
+            grouped[(result.compression_algorithm, result.encryption_algorithm)].append(result)
+        return dict(grouped)
     
     def print_summary(self):
         """Print summary of benchmark results"""
@@ -641,13 +833,15 @@ class GSEABenchmark:
         print(f"  BENCHMARK SUMMARY")
         print(f"{'='*70}\n")
         
+        table = _results_table(self.results)
+        
         # Overall statistics
-        total_tests = len(self.results)
-        successful = sum(1 for r in self.results if r.exit_code == 0)
+        total_tests = len(table)
+        successful = int(np.count_nonzero(table.exit_code == 0))
         failed = total_tests - successful
         
-        leaks = sum(1 for r in self.results if r.leaks_detected)
-        zombies = sum(1 for r in self.results if r.zombies_detected)
+        leaks = int(np.count_nonzero(table.leaks_detected))
+        zombies = int(np.count_nonzero(table.zombies_detected))
         
         print(f"Total tests: {total_tests}")
         print(f"Successful: {successful} ({successful/total_tests*100:.1f}%)")
@@ -657,10 +851,10 @@ class GSEABenchmark:
         print()
         
         # Performance stats
-        avg_time = sum(r.time_seconds for r in self.results) / total_tests
-        avg_cpu = sum(r.cpu_percent for r in self.results) / total_tests
-        avg_mem = sum(r.memory_mb for r in self.results) / total_tests
-        avg_compression = sum(r.compression_ratio for r in self.results) / total_tests
+        avg_time = table.time_seconds.mean()
+        avg_cpu = table.cpu_percent.mean()
+        avg_mem = table.memory_mb.mean()
+        avg_compression = table.compression_ratio.mean()
         
         print(f"Average execution time: {avg_time:.2f} seconds")
         print(f"Average CPU usage: {avg_cpu:.1f}%")
@@ -669,9 +863,9 @@ class GSEABenchmark:
         print()
         
         # Best performers
-        best_time = min(self.results, key=lambda r: r.time_seconds)
-        best_compression = max(self.results, key=lambda r: r.compression_ratio)
-        best_throughput = max(self.results, key=lambda r: r.throughput_mbps)
+        best_time = table[table.time_seconds.argmin()]
+        best_compression = table[table.compression_ratio.argmax()]
+        best_throughput = table[table.throughput_mbps.argmax()]
         
         print("🏆 Best Performers:")
         print(f"  Fastest: {best_time.compression_algorithm}+{best_time.encryption_algorithm} "
@@ -684,6 +878,32 @@ class GSEABenchmark:
         print(f"\n{'='*70}\n")
 
 
+def _positive_int(value: str) -> int:
+    """Argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _plot_formats(value: str) -> Tuple[str, ...]:
+    """Argparse type for a comma-separated list of formats matplotlib can save"""
+    formats = tuple(f.strip() for f in value.split(',') if f.strip())
+    if not formats:
+        raise argparse.ArgumentTypeError("at least one plot format is required")
+    supported = FigureCanvasBase.get_supported_filetypes()
+    unknown = [f for f in formats if f not in supported]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unsupported format(s): {', '.join(unknown)} "
+            f"(choose from {', '.join(sorted(supported))})"
+        )
+    return formats
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -702,6 +922,9 @@ Examples:
 
   # With valgrind (slow!)
   python3 benchmark_tests.py --binary ./bin/gsea --quick --valgrind
+
+  # PNG plots only (skip PDF rendering)
+  python3 benchmark_tests.py --binary ./bin/gsea --quick --formats png
         """
     )
     
@@ -721,6 +944,12 @@ Examples:
                        help='File sizes in bytes (e.g., 1024 10240 102400)')
     parser.add_argument('--pattern', choices=['random', 'text', 'repetitive'],
                        default='text', help='Data pattern for test files')
+    parser.add_argument('--threads', type=_positive_int, default=1,
+                       help='Threads per gsea process (default: 1, one process per CPU)')
+    parser.add_argument('--formats', default='png,pdf', type=_plot_formats,
+                       help='Comma-separated plot formats (default: png,pdf)')
+    parser.add_argument('--capture', action='store_true',
+                       help='Save gsea stdout/stderr to the logs directory')
     
     args = parser.parse_args()
     
@@ -750,7 +979,8 @@ Examples:
     
     try:
         # Create benchmark instance
-        benchmark = GSEABenchmark(args.binary, args.output)
+        benchmark = GSEABenchmark(args.binary, args.output, threads=args.threads,
+                                  plot_formats=args.formats, capture_output=args.capture)
         
         # Run benchmarks
         benchmark.run_benchmarks(